@@ -0,0 +1,39 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python loops
+    njit = None
+
+
+def _filter_far(pts, thresh_sq):
+    """
+    Return the rows of an (N, 2) array that are at least sqrt(thresh_sq)
+    away from the previously kept row. The first and last rows are always
+    kept, unless the last one repeats the previously kept row.
+    """
+    n = pts.shape[0]
+    out = np.empty((n, 2), dtype=np.float64)
+    if n == 0:
+        return out
+    out[0, 0] = pts[0, 0]
+    out[0, 1] = pts[0, 1]
+    kept = 1
+    for i in range(1, n):
+        dx = pts[i, 0] - out[kept - 1, 0]
+        dy = pts[i, 1] - out[kept - 1, 1]
+        if dx * dx + dy * dy >= thresh_sq:
+            out[kept, 0] = pts[i, 0]
+            out[kept, 1] = pts[i, 1]
+            kept += 1
+    # Keep the stroke end point (the forced release point) even when close
+    dx = pts[n - 1, 0] - out[kept - 1, 0]
+    dy = pts[n - 1, 1] - out[kept - 1, 1]
+    if dx * dx + dy * dy > 0.0:
+        out[kept, 0] = pts[n - 1, 0]
+        out[kept, 1] = pts[n - 1, 1]
+        kept += 1
+    return out[:kept]
+
+
+filter_far = njit(cache=True)(_filter_far) if njit is not None else _filter_far
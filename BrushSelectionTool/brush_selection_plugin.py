@@ -1,19 +1,82 @@
+import contextlib
+import math
 import os
+import struct
+from functools import cache
+from itertools import islice
 
+import numpy as np
 from qgis.core import (
+    Qgis,
+    QgsApplication,
     QgsCoordinateTransform,
     QgsFeatureRequest,
+    QgsFeatureSource,
     QgsGeometry,
     QgsPointXY,
     QgsProject,
     QgsRenderContext,
+    QgsSpatialIndex,
+    QgsTask,
+    QgsTaskManager,
     QgsVectorLayer,
+    QgsVectorLayerFeatureSource,
     QgsWkbTypes,
 )
 from qgis.gui import QgsMapTool, QgsRubberBand
-from qgis.PyQt.QtCore import QElapsedTimer, Qt
+from qgis.PyQt import sip
+from qgis.PyQt.QtCore import QElapsedTimer, Qt, QTimer
 from qgis.PyQt.QtGui import QColor, QIcon
-from qgis.PyQt.QtWidgets import QAction
+from qgis.PyQt.QtWidgets import QAction, QProgressBar
+
+from ._stroke_kernels import filter_far
+
+try:
+    import shapely
+
+    if not hasattr(shapely, "linestrings"):  # vectorized API is Shapely >= 2.0
+        shapely = None
+except ImportError:
+    shapely = None
+
+
+class _LayerCache:
+    """
+    Values cached per layer id, dropped as soon as the layer emits any of
+    the given signals (or when the cache is cleared).
+    """
+
+    def __init__(self, *signals):
+        self._signals = signals
+        self._entries = {}  # layer id -> (layer, value, slot)
+
+    def get(self, layer):
+        entry = self._entries.get(layer.id())
+        return entry[1] if entry is not None else None
+
+    def set(self, layer, value):
+        lid = layer.id()
+        self.drop(lid)
+
+        def slot(*args):
+            self.drop(lid)
+
+        self._entries[lid] = (layer, value, slot)
+        for name in self._signals:
+            getattr(layer, name).connect(slot)
+
+    def drop(self, lid):
+        entry = self._entries.pop(lid, None)
+        if entry is None:
+            return
+        layer, _value, slot = entry
+        for name in self._signals:
+            with contextlib.suppress(TypeError, RuntimeError):
+                getattr(layer, name).disconnect(slot)
+
+    def clear(self):
+        for lid in list(self._entries):
+            self.drop(lid)
 
 
 class BrushSelectionTool(QgsMapTool):
@@ -25,6 +88,13 @@ class BrushSelectionTool(QgsMapTool):
     - Selection is done once with spatially indexed bbox prefiltering.
     """
 
+    STROKE_REFRESH_MS = 16  # live stroke rebuild interval (~60 Hz)
+    SELECTION_COMMIT_MS = 250  # window for merging add-to-selection strokes
+    ASYNC_CANDIDATE_THRESHOLD = 100000  # larger layers are selected in a QgsTask
+    STROKE_SPLIT_THRESHOLD = 64  # strokes longer than this are buffered in chunks
+    STROKE_CHUNK_SIZE = 32  # points per chunk (consecutive chunks share a point)
+    STROKE_SIMPLIFY_FACTOR = 0.1  # simplify tolerance as a fraction of the radius
+
     def __init__(
         self,
         iface,
@@ -43,8 +113,11 @@ class BrushSelectionTool(QgsMapTool):
         self.active_layer_only = active_layer_only
 
         self.dragging = False
-        self.path_points = []  # QgsPointXY[]
-        self._last_added = None
+        # Recorded path as x, y rows; QgsPointXY are only built for GEOS calls
+        self._pts = np.empty((64, 2), dtype=np.float64)
+        self._n = 0  # number of valid rows in _pts
+        self._last_added = None  # (x, y) of the last recorded point
+        self._reset_stroke_cache()
         self.shift_pressed = False
         self.setCursor(Qt.CrossCursor)
 
@@ -59,6 +132,39 @@ class BrushSelectionTool(QgsMapTool):
         self.cursor_rb.setColor(QColor(0, 150, 255, 80))
         self.cursor_rb.setWidth(1)
         self.cursor_rb.setStrokeColor(QColor(0, 100, 200, 180))
+        self._cursor_circle_geom = None  # circle centred on the origin
+        self._cursor_radius_mu = None  # radius_mu the circle was built with
+
+        # Coalesce live stroke rebuilds to ~60 Hz instead of every mouse event
+        self._rb_timer = QTimer()
+        self._rb_timer.setSingleShot(True)
+        self._rb_timer.timeout.connect(self._updateStrokeRubberBand)
+
+        # Ids from add-to-selection strokes, committed in one selectByIds
+        # per layer once strokes stop arriving
+        self._pending_ids = {}  # layer id -> set of feature ids
+        self._commit_timer = QTimer()
+        self._commit_timer.setSingleShot(True)
+        self._commit_timer.setInterval(self.SELECTION_COMMIT_MS)
+        self._commit_timer.timeout.connect(self._commit_pending_selection)
+
+        # Per-layer spatial indexes for providers without a native one.
+        # Edit buffer changes are not listed: the index is not used while the
+        # layer is editable, and commit or rollback emits editingStopped.
+        self._sindex_cache = _LayerCache(
+            "editingStopped",
+            "dataChanged",
+            "subsetStringChanged",
+            "willBeDeleted",
+        )
+        # Per-layer renderer clones used for the visibility check. Legend
+        # toggles (hidden categories, disabled rules) edit the renderer in
+        # place and only emit styleChanged.
+        self._renderer_cache = _LayerCache(
+            "rendererChanged",
+            "styleChanged",
+            "willBeDeleted",
+        )
 
     # ---------- Public knobs ----------
     def setRadiusPx(self, radius_px):
@@ -76,23 +182,29 @@ class BrushSelectionTool(QgsMapTool):
             return
         self.dragging = True
         self.shift_pressed = event.modifiers() & Qt.ShiftModifier
-        self.path_points = []
+        self._n = 0
         self._last_added = None
+        self._reset_stroke_cache()
         self._append_point_if_far(event.mapPoint(), force=True)
         self._updateVisuals(event.mapPoint())
 
     def canvasMoveEvent(self, event):
+        # Query the canvas scale once per event; both helpers need it
+        mupp = self.canvas.mapUnitsPerPixel()
+        map_point = event.mapPoint()
+
         # Always update the visuals to show brush tip
-        self._updateVisuals(event.mapPoint())
+        self._updateVisuals(map_point, mupp=mupp)
 
         if not self.dragging or not (event.buttons() & Qt.LeftButton):
             return
 
         # Record points with spacing threshold (in pixels -> map units)
-        self._append_point_if_far(event.mapPoint())
+        self._append_point_if_far(map_point, mupp=mupp)
 
-        # Update the live stroke (buffered path) as you drag
-        self._updateStrokeRubberBand()
+        # Update the live stroke (buffered path) as you drag, throttled
+        if not self._rb_timer.isActive():
+            self._rb_timer.start(self.STROKE_REFRESH_MS)
 
     def canvasReleaseEvent(self, event):
         if event.button() != Qt.LeftButton or not self.dragging:
@@ -101,16 +213,29 @@ class BrushSelectionTool(QgsMapTool):
         self.dragging = False
         self._append_point_if_far(event.mapPoint(), force=True)
 
+        # Flush any pending live stroke update before selecting
+        if self._rb_timer.isActive():
+            self._rb_timer.stop()
+            self._updateStrokeRubberBand()
+
         # Build final stroke geometry and select once
-        stroke_geom = self._build_stroke_geometry(
-            self.path_points, self._radius_mu(), self.segments
-        )
+        xy = self._stroke_xy()
+        radius_mu = self._radius_mu()
+        stroke_geom = self._build_stroke_geometry(xy, radius_mu, self.segments)
         if stroke_geom and not stroke_geom.isEmpty():
-            self._select_features(stroke_geom)
+            disc = None
+            if len(xy) == 1:
+                # Inscribed radius of the circle polygon, so the disc lies
+                # entirely inside the stroke geometry
+                n = 4 * max(8, self.segments)
+                r_in = radius_mu * math.cos(math.pi / n)
+                disc = (float(xy[0, 0]), float(xy[0, 1]), r_in)
+            self._select_features(stroke_geom, disc)
 
         # Reset
-        self.path_points = []
+        self._n = 0
         self._last_added = None
+        self._reset_stroke_cache()
         self.stroke_rb.reset(QgsWkbTypes.PolygonGeometry)
 
     def wheelEvent(self, event):
@@ -149,66 +274,201 @@ class BrushSelectionTool(QgsMapTool):
         super().keyReleaseEvent(event)
 
     def deactivate(self):
+        self._rb_timer.stop()
+        self._commit_pending_selection()
+        self._sindex_cache.clear()
+        self._renderer_cache.clear()
+        self._reset_stroke_cache()
         self.stroke_rb.reset(QgsWkbTypes.PolygonGeometry)
         self.cursor_rb.reset(QgsWkbTypes.PolygonGeometry)
         super().deactivate()
 
     # ---------- Helpers ----------
-    def _radius_mu(self) -> float:
+    def _radius_mu(self, mupp=None) -> float:
         """Convert current pixel radius to map units based on current zoom."""
-        return float(self.radius_px) * self.canvas.mapUnitsPerPixel()
+        if mupp is None:
+            mupp = self.canvas.mapUnitsPerPixel()
+        return float(self.radius_px) * mupp
 
-    def _append_point_if_far(self, map_point: QgsPointXY, force: bool = False):
-        mp = map_point
-        if self._last_added is None or force:
-            self.path_points.append(mp)
-            self._last_added = mp
-            return
-
-        # Threshold: ~2 pixels
+    def _append_point_if_far(
+        self, map_point: QgsPointXY, force: bool = False, mupp=None
+    ):
+        x, y = map_point.x(), map_point.y()
+        if self._last_added is not None and not force:
+            # Threshold: ~2 pixels
+            if mupp is None:
+                mupp = self.canvas.mapUnitsPerPixel()
+            threshold_mu = 2.0 * mupp
+            dx = x - self._last_added[0]
+            dy = y - self._last_added[1]
+            if dx * dx + dy * dy < threshold_mu * threshold_mu:
+                return
+
+        if self._n == len(self._pts):
+            grown = np.empty((2 * len(self._pts), 2), dtype=np.float64)
+            grown[: self._n] = self._pts
+            self._pts = grown
+        self._pts[self._n] = (x, y)
+        self._n += 1
+        self._last_added = (x, y)
+
+    def _stroke_xy(self):
+        """
+        Recorded path re-thinned to ~2 px at the current zoom, for rebuilding
+        the whole stroke (release, radius or zoom change).
+        """
         threshold_mu = 2.0 * self.canvas.mapUnitsPerPixel()
-        if self._dist_sq(mp, self._last_added) >= threshold_mu * threshold_mu:
-            self.path_points.append(mp)
-            self._last_added = mp
+        return filter_far(self._pts[: self._n], threshold_mu * threshold_mu)
 
-    @staticmethod
-    def _dist_sq(a: QgsPointXY, b: QgsPointXY) -> float:
-        dx = a.x() - b.x()
-        dy = a.y() - b.y()
-        return dx * dx + dy * dy
-
-    def _updateVisuals(self, map_point: QgsPointXY):
+    def _updateVisuals(self, map_point: QgsPointXY, mupp=None):
         """Update the cursor circle at the tip and keep stroke_rb unchanged here."""
-        circle = QgsGeometry.fromPointXY(map_point).buffer(
-            self._radius_mu(), max(8, self.segments)
-        )
+        radius_mu = self._radius_mu(mupp)
+        if self._cursor_circle_geom is None or radius_mu != self._cursor_radius_mu:
+            self._cursor_circle_geom = self._circle_geometry(
+                QgsPointXY(0, 0), radius_mu, max(8, self.segments)
+            )
+            self._cursor_radius_mu = radius_mu
+        circle = QgsGeometry(self._cursor_circle_geom)
+        circle.translate(map_point.x(), map_point.y())
         self.cursor_rb.setToGeometry(circle, None)
 
+    def _reset_stroke_cache(self):
+        """Forget the incrementally buffered live stroke."""
+        self._stroke_cache = None  # QgsGeometry of the buffered prefix
+        self._stroke_cache_radius = None  # radius_mu the cache was built with
+        self._stroke_cache_count = 0  # number of recorded points covered
+
     def _updateStrokeRubberBand(self):
-        """Update the live *stroke* rubber band (buffered polyline)."""
-        if not self.path_points:
+        """
+        Update the live *stroke* rubber band (buffered polyline).
+
+        The buffered prefix is cached, so only the newly recorded segment is
+        re-buffered and then unioned into the cached polygon instead of
+        buffering the whole path again. A radius change (wheel or zoom)
+        forces a full rebuild.
+        """
+        if not self._n:
+            self._reset_stroke_cache()
             self.stroke_rb.reset(QgsWkbTypes.PolygonGeometry)
             return
 
-        stroke = self._build_stroke_geometry(
-            self.path_points, self._radius_mu(), self.segments
-        )
-        if stroke and not stroke.isEmpty():
-            self.stroke_rb.setToGeometry(stroke, None)
+        radius_mu = self._radius_mu()
+        count = self._n
+        if self._stroke_cache is None or radius_mu != self._stroke_cache_radius:
+            stroke = self._build_stroke_geometry(
+                self._stroke_xy(), radius_mu, self.segments
+            )
+        elif count > self._stroke_cache_count:
+            # Overlap by one point so the new capsule joins the cached prefix
+            tail = self._pts[self._stroke_cache_count - 1 : self._n]
+            seg_buf = self._build_stroke_geometry(tail, radius_mu, self.segments)
+            stroke = self._stroke_cache.combine(seg_buf) if seg_buf else None
+        else:
+            return
+
+        if not stroke or stroke.isEmpty():
+            self._reset_stroke_cache()
+            return
+
+        self._stroke_cache = stroke
+        self._stroke_cache_radius = radius_mu
+        self._stroke_cache_count = count
+        self.stroke_rb.setToGeometry(stroke, None)
 
-    def _build_stroke_geometry(self, points, radius_mu, segments):
-        if not points:
+    def _build_stroke_geometry(self, xy, radius_mu, segments):
+        """Buffer the (N, 2) array of stroke points into the brush polygon."""
+        if not len(xy):
             return None
         try:
-            if len(points) == 1:
-                return QgsGeometry.fromPointXY(points[0]).buffer(
-                    radius_mu, max(8, segments)
-                )
-            line = QgsGeometry.fromPolylineXY(points)
+            if len(xy) == 1:
+                center = QgsPointXY(float(xy[0, 0]), float(xy[0, 1]))
+                return self._circle_geometry(center, radius_mu, max(8, segments))
+            if shapely is not None:
+                return self._buffer_polyline_shapely(xy, radius_mu, segments)
+            # Drop near-collinear vertices before buffering; the tolerance is
+            # small relative to the radius so the stroke outline barely moves
+            line = self._polyline_from_xy(xy)
+            simplified = line.simplify(self.STROKE_SIMPLIFY_FACTOR * radius_mu)
+            if simplified and not simplified.isEmpty():
+                line = simplified
+                xy = self._polyline_to_xy(line)
+            if len(xy) > self.STROKE_SPLIT_THRESHOLD:
+                # Buffer overlapping chunks and union them: cheaper than one
+                # buffer over a long, densely sampled polyline
+                step = self.STROKE_CHUNK_SIZE - 1
+                parts = [
+                    self._polyline_from_xy(xy[i : i + self.STROKE_CHUNK_SIZE]).buffer(
+                        radius_mu, max(8, segments)
+                    )
+                    for i in range(0, len(xy) - 1, step)
+                ]
+                return QgsGeometry.unaryUnion(parts)
             return line.buffer(radius_mu, max(8, segments))
         except Exception:
             return None
 
+    @staticmethod
+    def _polyline_from_xy(xy) -> QgsGeometry:
+        """LineString from an (N, 2) array via WKB, without per-vertex QgsPointXY."""
+        # Little endian byte order flag, WKB type 2 (LineString), point count
+        header = struct.pack("<BII", 1, 2, len(xy))
+        coords = np.ascontiguousarray(xy, dtype="<f8").tobytes()
+        geom = QgsGeometry()
+        geom.fromWkb(header + coords)
+        return geom
+
+    @staticmethod
+    def _polyline_to_xy(line: QgsGeometry):
+        """(N, 2) array of the vertices of a 2D LineString, read from its WKB."""
+        wkb = bytes(line.asWkb())
+        order = "<" if wkb[0] == 1 else ">"
+        # Skip byte order (1), type (4) and point count (4)
+        return np.frombuffer(wkb, dtype=f"{order}f8", offset=9).reshape(-1, 2)
+
+    def _buffer_polyline_shapely(self, xy, radius_mu, segments):
+        """Same as the QgsGeometry path, but with Shapely's vectorized calls."""
+        line = shapely.simplify(
+            shapely.linestrings(xy), self.STROKE_SIMPLIFY_FACTOR * radius_mu
+        )
+        quad_segs = max(8, segments)
+        coords = shapely.get_coordinates(line)
+        if len(coords) > self.STROKE_SPLIT_THRESHOLD:
+            step = self.STROKE_CHUNK_SIZE - 1
+            chunks = [
+                shapely.linestrings(coords[i : i + self.STROKE_CHUNK_SIZE])
+                for i in range(0, len(coords) - 1, step)
+            ]
+            stroke = shapely.union_all(
+                shapely.buffer(chunks, radius_mu, quad_segs=quad_segs)
+            )
+        else:
+            stroke = shapely.buffer(line, radius_mu, quad_segs=quad_segs)
+        geom = QgsGeometry()
+        geom.fromWkb(shapely.to_wkb(stroke))
+        return geom
+
+    @staticmethod
+    @cache
+    def _unit_circle(segments):
+        """Closed unit circle ring with ``segments`` vertices per quadrant."""
+        n = 4 * segments
+        ring = [
+            (math.cos(2.0 * math.pi * i / n), math.sin(2.0 * math.pi * i / n))
+            for i in range(n)
+        ]
+        ring.append(ring[0])
+        return tuple(ring)
+
+    @classmethod
+    def _circle_geometry(cls, center: QgsPointXY, radius_mu, segments):
+        """Polygonal circle built from the cached unit ring, without GEOS."""
+        cx, cy = center.x(), center.y()
+        ring = [
+            QgsPointXY(cx + radius_mu * ux, cy + radius_mu * uy)
+            for ux, uy in cls._unit_circle(segments)
+        ]
+        return QgsGeometry.fromPolygonXY([ring])
+
     def _iter_target_layers(self):
         if self.active_layer_only:
             lyr = self.iface.activeLayer()
@@ -219,7 +479,116 @@ class BrushSelectionTool(QgsMapTool):
             if layer.type() == layer.VectorLayer:
                 yield layer
 
-    def _select_features(self, geom: QgsGeometry):
+    def _spatial_index(self, layer):
+        """
+        Return a cached QgsSpatialIndex for layers whose provider has none.
+
+        Layers backed by an indexed provider return None and rely on
+        setFilterRect, as do layers in edit mode, whose edit buffer changes
+        with every edit, and layers too large to scan on the GUI thread. The
+        index is built on first use and dropped whenever the layer's features
+        change.
+        """
+        if layer.isEditable():
+            return None
+        sindex = self._sindex_cache.get(layer)
+        if sindex is not None:
+            return sindex
+        if layer.hasSpatialIndex() != QgsFeatureSource.SpatialIndexNotPresent:
+            return None
+        if layer.featureCount() > self.ASYNC_CANDIDATE_THRESHOLD:
+            # Building would be a full synchronous scan; the rect request
+            # path can hand large candidate sets to a background task instead
+            return None
+
+        sindex = QgsSpatialIndex(
+            layer.getFeatures(QgsFeatureRequest().setNoAttributes())
+        )
+        self._sindex_cache.set(layer, sindex)
+        return sindex
+
+    def _render_state(self, layer):
+        """
+        Return a cached (renderer clone, render context) for *layer*.
+
+        The clone is reused across strokes and dropped when the layer's
+        renderer or style changes; callers still start/stop it per stroke.
+        """
+        state = self._renderer_cache.get(layer)
+        if state is not None:
+            return state
+
+        renderer = layer.renderer().clone()
+        context = QgsRenderContext()
+        context.setExpressionContext(layer.createExpressionContext())
+        state = (renderer, context)
+        self._renderer_cache.set(layer, state)
+        return state
+
+    @staticmethod
+    def _estimate_candidates(layer, bbox) -> int:
+        """
+        Rough number of features a rect request for ``bbox`` has to scan.
+
+        Providers without a spatial index (memory, GeoJSON, ...) scan the whole
+        layer whatever the rect, so that is the layer's feature count. For
+        indexed providers it is the feature count scaled by the share of the
+        layer extent ``bbox`` covers.
+        """
+        count = layer.featureCount()
+        if count <= 0:
+            return 0
+        if layer.hasSpatialIndex() == QgsFeatureSource.SpatialIndexNotPresent:
+            return count
+        extent = layer.extent()
+        if extent.isEmpty():  # single point or axis-aligned layer: no area to scale
+            return count
+        if not extent.intersects(bbox):
+            return 0
+        overlap = extent.intersect(bbox)
+        return int(count * overlap.area() / extent.area())
+
+    @staticmethod
+    def _bbox_in_disc(rect, disc) -> bool:
+        """True if all corners of ``rect`` lie inside the (cx, cy, r) disc."""
+        cx, cy, r = disc
+        dx = max(abs(rect.xMinimum() - cx), abs(rect.xMaximum() - cx))
+        dy = max(abs(rect.yMinimum() - cy), abs(rect.yMaximum() - cy))
+        return dx * dx + dy * dy <= r * r
+
+    @staticmethod
+    def _matching_ids(features, engine, disc=None, renderer=None, context=None):
+        """
+        Yield ids of ``features`` intersecting the prepared stroke ``engine``
+        and, when a started ``renderer`` is given, that it would draw.
+        """
+        for feat in features:
+            fgeom = feat.geometry()
+            if not fgeom or fgeom.isEmpty():
+                continue
+            # Bbox tiers: candidates outside the stroke bbox never get here
+            # (index query or provider rect filter), a bbox covered
+            # by the click disc is accepted outright, and only the
+            # straddling rest pays for the prepared GEOS test
+            fully_inside = disc is not None and BrushSelectionTool._bbox_in_disc(
+                fgeom.boundingBox(), disc
+            )
+            if not fully_inside and not engine.intersects(fgeom.constGet()):
+                continue
+            if renderer is not None:
+                context.expressionContext().setFeature(feat)
+                if not renderer.willRenderFeature(feat, context):
+                    continue
+            yield feat.id()
+
+    def _select_features(self, geom: QgsGeometry, disc=None):
+        """
+        Select features intersecting ``geom`` on the target layers.
+
+        ``disc`` is an optional (cx, cy, r) circle contained in ``geom`` (canvas
+        CRS); features whose bbox lies inside it are accepted without a GEOS
+        intersects test.
+        """
         canvas_crs = self.canvas.mapSettings().destinationCrs()
         total = 0
         layer_counts = []
@@ -227,53 +596,113 @@ class BrushSelectionTool(QgsMapTool):
         self.canvas.setRenderFlag(False)
         timer = QElapsedTimer()
         timer.start()
+        should_add = self.add_to_selection or self.shift_pressed
+
+        # The stroke is reprojected and prepared once per layer CRS, so layers
+        # sharing a CRS reuse the same prepared engine
+        strokes = {}  # CRS key -> (stroke geometry, disc) in that CRS
+        engines = {}  # CRS key -> prepared geometry engine
 
         for layer in self._iter_target_layers():
             layer_crs = layer.crs()
-            if canvas_crs != layer_crs:
-                transform = QgsCoordinateTransform(canvas_crs, layer_crs, QgsProject.instance())
-                layer_geom = QgsGeometry(geom)
-                layer_geom.transform(transform)
-            else:
-                layer_geom = geom
+            crs_key = layer_crs.authid() or layer_crs.toWkt()
+            if crs_key not in strokes:
+                if canvas_crs != layer_crs:
+                    transform = QgsCoordinateTransform(
+                        canvas_crs, layer_crs, QgsProject.instance()
+                    )
+                    layer_geom = QgsGeometry(geom)
+                    layer_geom.transform(transform)
+                    strokes[crs_key] = (layer_geom, None)  # no circle once reprojected
+                else:
+                    strokes[crs_key] = (geom, disc)
+            layer_geom, layer_disc = strokes[crs_key]
 
             bbox = layer_geom.boundingBox()
-            req = QgsFeatureRequest().setFilterRect(bbox).setSubsetOfAttributes([])
-            req.setFlags(QgsFeatureRequest.NoFlags)
-
-            renderer = layer.renderer().clone()
-            context = QgsRenderContext()
-            context.setExpressionContext(layer.createExpressionContext())
-            renderer.startRender(context, layer.fields())
-
-            ids = []
-            for feat in layer.getFeatures(req):
-                fgeom = feat.geometry()
-                if not fgeom or fgeom.isEmpty():
-                    continue
-                if fgeom.intersects(layer_geom):
-                    context.expressionContext().setFeature(feat)
-                    if renderer.willRenderFeature(feat, context):
-                        ids.append(feat.id())
-
-            renderer.stopRender(context)
-
-            if ids:
-                should_add = self.add_to_selection or self.shift_pressed
-                method = (
-                    QgsVectorLayer.AddToSelection
-                    if should_add
-                    else QgsVectorLayer.SetSelection
-                )
-                layer.selectByIds(ids, method)
-                layer_counts.append((layer.name(), len(ids)))
-                total += len(ids)
+
+            sindex = self._spatial_index(layer)
+            if sindex is not None:
+                fids = sindex.intersects(bbox)
+                req = QgsFeatureRequest().setFilterFids(fids)
+                estimate = len(fids)
             else:
-                should_add = self.add_to_selection or self.shift_pressed
+                # The layer's subsetString is already part of the provider
+                # query, so it must not be repeated as a filter expression.
+                req = QgsFeatureRequest().setFilterRect(bbox)
+                if layer.providerType() == "postgres":
+                    # PostGIS rejects bbox-only hits in SQL; other providers
+                    # would run the rect test client side, right before the
+                    # stronger prepared stroke test
+                    req.setFlags(QgsFeatureRequest.ExactIntersect)
+                estimate = self._estimate_candidates(layer, bbox)
+            req.setNoAttributes()
+
+            # Too many candidates to scan without freezing the GUI. Once a
+            # layer has a task in flight, later strokes on it are queued
+            # behind it too, so selections are applied in stroke order.
+            if estimate > self.ASYNC_CANDIDATE_THRESHOLD or (
+                BrushSelectionTask.is_running(layer.id())
+            ):
                 if not should_add:
+                    # Replacing the selection supersedes any queued additions
+                    self._pending_ids.pop(layer.id(), None)
+                BrushSelectionTask.submit(
+                    self.iface,
+                    layer,
+                    layer_geom,
+                    layer_disc,
+                    req,
+                    estimate,
+                    should_add,
+                )
+                # The task reports its own count when it finishes
+                layer_counts.append((layer.name(), "running in background"))
+                continue
+
+            # Prepare the stroke once so each intersects test reuses its index
+            engine = engines.get(crs_key)
+            if engine is None:
+                engine = QgsGeometry.createGeometryEngine(layer_geom.constGet())
+                engine.prepareGeometry()
+                engines[crs_key] = engine
+
+            # A single symbol renderer draws every feature, so only other
+            # renderers need the (expression evaluating) visibility check
+            renderer = layer.renderer()
+            context = None
+            if renderer is not None and renderer.type() != "singleSymbol":
+                renderer, context = self._render_state(layer)
+                renderer.startRender(context, layer.fields())
+                req.setSubsetOfAttributes(
+                    renderer.usedAttributes(context), layer.fields()
+                )
+            else:
+                renderer = None
+
+            ids = list(
+                self._matching_ids(
+                    layer.getFeatures(req), engine, layer_disc, renderer, context
+                )
+            )
+
+            if renderer is not None:
+                renderer.stopRender(context)
+
+            if should_add:
+                if ids:
+                    self._pending_ids.setdefault(layer.id(), set()).update(ids)
+            else:
+                # Replacing the selection supersedes any queued additions
+                self._pending_ids.pop(layer.id(), None)
+                if ids:
+                    layer.selectByIds(ids, QgsVectorLayer.SetSelection)
+                else:
                     layer.removeSelection()
-                layer_counts.append((layer.name(), len(ids)))
-                total += len(ids)
+            layer_counts.append((layer.name(), len(ids)))
+            total += len(ids)
+
+        if self._pending_ids:
+            self._commit_timer.start()
 
         elapsed_ms = timer.elapsed()
         self.canvas.setRenderFlag(True)
@@ -284,10 +713,157 @@ class BrushSelectionTool(QgsMapTool):
             msg = f"Brush selected {total} feature(s) [{per_layer}] in {elapsed_ms} ms"
         else:
             msg = f"Brush selected 0 features in {elapsed_ms} ms"
-        try:
+        with contextlib.suppress(Exception):
             self.iface.mainWindow().statusBar().showMessage(msg, 5000)
-        except Exception:
-            pass
+
+    def _commit_pending_selection(self):
+        """Add the ids queued by recent strokes to each layer's selection."""
+        self._commit_timer.stop()
+        pending, self._pending_ids = self._pending_ids, {}
+        for lid, ids in pending.items():
+            layer = QgsProject.instance().mapLayer(lid)
+            if layer is not None:
+                layer.selectByIds(sorted(ids), QgsVectorLayer.AddToSelection)
+
+
+class BrushSelectionTask(QgsTask):
+    """
+    Brush selection on one large layer, run in the background.
+
+    Candidates are read from a feature source snapshot in chunks so the task
+    can report progress and be cancelled; the selection is applied on the
+    main thread when the task finishes.
+    """
+
+    CHUNK_SIZE = 10000
+
+    # PyQGIS tasks must stay referenced from Python until they finish
+    _running = set()
+    _latest = {}  # layer id -> most recently submitted task for that layer
+
+    @classmethod
+    def is_running(cls, layer_id) -> bool:
+        return layer_id in cls._latest
+
+    @classmethod
+    def submit(cls, iface, layer, stroke, disc, request, estimate, should_add):
+        """
+        Create a task and hand it to the application task manager.
+
+        Tasks on one layer never race: an add-to-selection task waits for
+        the previous one, a replacing task cancels all tasks still queued or
+        running on the layer since their results would be overwritten anyway.
+        """
+        task = cls(iface, layer, stroke, disc, request, estimate, should_add)
+        previous = cls._latest.get(layer.id())
+        dependencies = []
+        if should_add:
+            if previous is not None:
+                dependencies.append(previous)
+        else:
+            for other in list(cls._running):
+                if other.layer_id == layer.id():
+                    other.cancel()
+        cls._running.add(task)
+        cls._latest[layer.id()] = task
+        QgsApplication.taskManager().addTask(
+            QgsTaskManager.TaskDefinition(task, dependencies)
+        )
+        return task
+
+    def __init__(self, iface, layer, stroke, disc, request, estimate, should_add):
+        super().__init__(f"Brush selection on {layer.name()}", QgsTask.CanCancel)
+        self.iface = iface
+        self.layer_id = layer.id()
+        self.layer_name = layer.name()
+        self.source = QgsVectorLayerFeatureSource(layer)
+        self.fields = layer.fields()
+        self.stroke = QgsGeometry(stroke)
+        self.disc = disc
+        self.request = QgsFeatureRequest(request)
+        self.estimate = max(1, estimate)
+        self.should_add = should_add
+        self.ids = []
+
+        # The task needs its own renderer clone: it is started in the worker
+        self.renderer = None
+        self.context = None
+        renderer = layer.renderer()
+        if renderer is not None and renderer.type() != "singleSymbol":
+            self.renderer = renderer.clone()
+            self.context = QgsRenderContext()
+            self.context.setExpressionContext(layer.createExpressionContext())
+
+        self._message = None  # message bar item, deleted if the user closes it
+        self._progress = None
+        self._push_progress_message()
+
+    def _push_progress_message(self):
+        bar = self.iface.messageBar()
+        widget = bar.createMessage(
+            "Brush Selection", f"Selecting features in {self.layer_name}…"
+        )
+        self._progress = QProgressBar()
+        self._progress.setMaximum(100)
+        widget.layout().addWidget(self._progress)
+        self.progressChanged.connect(self._on_progress)
+        self._message = bar.pushWidget(widget, Qgis.Info)
+
+    def _on_progress(self, value):
+        if not sip.isdeleted(self._progress):
+            self._progress.setValue(int(value))
+
+    def run(self):
+        engine = QgsGeometry.createGeometryEngine(self.stroke.constGet())
+        engine.prepareGeometry()
+        if self.renderer is not None:
+            self.renderer.startRender(self.context, self.fields)
+            self.request.setSubsetOfAttributes(
+                self.renderer.usedAttributes(self.context), self.fields
+            )
+        try:
+            features = self.source.getFeatures(self.request)
+            scanned = 0
+            while True:
+                chunk = list(islice(features, self.CHUNK_SIZE))
+                if not chunk:
+                    return True
+                self.ids.extend(
+                    BrushSelectionTool._matching_ids(
+                        chunk, engine, self.disc, self.renderer, self.context
+                    )
+                )
+                scanned += len(chunk)
+                self.setProgress(min(100.0, 100.0 * scanned / self.estimate))
+                if self.isCanceled():
+                    return False
+        finally:
+            if self.renderer is not None:
+                self.renderer.stopRender(self.context)
+
+    def finished(self, result):
+        BrushSelectionTask._running.discard(self)
+        if BrushSelectionTask._latest.get(self.layer_id) is self:
+            del BrushSelectionTask._latest[self.layer_id]
+        layer = QgsProject.instance().mapLayer(self.layer_id)
+        if result and layer is not None:
+            if self.should_add:
+                if self.ids:
+                    layer.selectByIds(self.ids, QgsVectorLayer.AddToSelection)
+            elif self.ids:
+                layer.selectByIds(self.ids, QgsVectorLayer.SetSelection)
+            else:
+                layer.removeSelection()
+
+            count = len(self.ids)
+            msg = f"Brush selected {count} feature(s) [{self.layer_name}: {count}]"
+            with contextlib.suppress(Exception):
+                self.iface.mainWindow().statusBar().showMessage(msg, 5000)
+
+        # Pop the progress message last; the user may already have closed it
+        if self._message is not None and not sip.isdeleted(self._message):
+            self.iface.messageBar().popWidget(self._message)
+        self._message = None
 
 
 class BrushSelectionPlugin: